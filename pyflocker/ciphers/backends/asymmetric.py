@@ -6,11 +6,15 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from ..base import BaseAsymmetricPadding, BaseMGF
-from ..interfaces import Hash
+from . import load_algorithm
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..base import BaseHash
 
+# ``new`` function of the default backend's Hash module. The default backend
+# never changes once it has been chosen, so it is resolved only once.
+_default_hash_new: typing.Optional[typing.Callable[..., BaseHash]] = None
+
 
 def _default_hash_factory():
     """SHA-256 Hash object factory.
@@ -18,8 +22,24 @@ def _default_hash_factory():
     The import is delayed because we want the backends to be loaded
     only when they are explicitly called by user or loaded by the
     backend loader.
+
+    A new object is returned for every padding, since hash objects are
+    mutable. The backends cache their padding objects by the name and the
+    digest size of the hash instead.
+    """
+    global _default_hash_new
+    if _default_hash_new is None:
+        _default_hash_new = load_algorithm("Hash").new
+    return _default_hash_new("sha256")
+
+
+def normalize_curve_name(name: str) -> str:
+    """Normalize the name of an elliptic curve for a lookup.
+
+    The case, spaces and hyphens are ignored, so that, for example,
+    ``NIST P-256``, ``P-256`` and ``p256`` have the same normalized name.
     """
-    return Hash.new("sha256")
+    return name.lower().replace(" ", "").replace("-", "")
 
 
 @dataclass(frozen=True)
@@ -5,22 +5,39 @@ import typing
 from Cryptodome.PublicKey import ECC
 
 from ... import base, exc
-from .asymmetric import ENCODINGS, FORMATS, PROTECTION_SCHEMES, get_DSS
+from ..asymmetric import normalize_curve_name
+from .asymmetric import (
+    ENCODINGS,
+    FORMATS,
+    PRIVATE_ENCODINGS,
+    PROTECTION_SCHEMES,
+    get_DSS,
+)
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
 
 CURVES = {k: k for k in ECC._curves}
 
+# CURVES indexed by the normalized curve names
+_NORMALIZED_CURVES = {normalize_curve_name(k): v for k, v in CURVES.items()}
+
 
 class ECCPrivateKey(base.BasePrivateKey):
     """ECC private key."""
 
+    __slots__ = ("_key", "_public_key", "__weakref__")
+
     def __init__(self, curve: str, **kwargs):
+        self._public_key = None
         if kwargs:
             self._key = kwargs.pop("key")
             return
         try:
-            self._key = ECC.generate(curve=CURVES[curve])
-        except KeyError as e:
+            curve_ = _NORMALIZED_CURVES[normalize_curve_name(curve)]
+        except (KeyError, AttributeError) as e:
             raise ValueError(f"Invalid curve: {curve}") from e
+        self._key = ECC.generate(curve=curve_)
 
     def public_key(self) -> ECCPublicKey:
         """Creates a public key from the private key
@@ -28,7 +45,11 @@ class ECCPrivateKey(base.BasePrivateKey):
         Returns:
             ECCPublicKey: A public key.
         """
-        return ECCPublicKey(self._key.public_key())
+        if (public_key := self._public_key) is None:
+            public_key = self._public_key = ECCPublicKey(
+                self._key.public_key()
+            )
+        return public_key
 
     def serialize(
         self,
@@ -68,7 +89,7 @@ class ECCPrivateKey(base.BasePrivateKey):
                 if the passphrase is not a bytes-like object when protection
                 is supplied.
         """
-        if encoding not in ENCODINGS.keys() ^ {"OpenSSH"}:
+        if encoding not in PRIVATE_ENCODINGS:
             raise TypeError("encoding must be PEM or DER")
 
         if format not in FORMATS:
@@ -174,6 +195,8 @@ class ECCPrivateKey(base.BasePrivateKey):
 class ECCPublicKey(base.BasePublicKey):
     """Represents ECC public key."""
 
+    __slots__ = ("_key", "__weakref__")
+
     def __init__(self, key):
         self._key = key
 
@@ -260,9 +283,12 @@ class ECCPublicKey(base.BasePublicKey):
 
 
 class _SigVerContext:
+    __slots__ = ("_is_private", "_sign_func", "_verify_func")
+
     def __init__(self, is_private, ctx):
         self._is_private = is_private
-        self._ctx = ctx
+        self._sign_func = ctx.sign
+        self._verify_func = ctx.verify
 
     def sign(self, msghash):
         """Return the signature of the message hash.
@@ -280,7 +306,7 @@ class _SigVerContext:
         """
         if not self._is_private:
             raise TypeError("Only private keys can sign messages.")
-        return self._ctx.sign(msghash)
+        return self._sign_func(msghash)
 
     def verify(self, msghash, signature):
         """Verifies the signature of the message hash.
@@ -302,7 +328,79 @@ class _SigVerContext:
         if self._is_private:
             raise TypeError("Only public keys can verify messages.")
         try:
-            self._ctx.verify(msghash, signature)
+            self._verify_func(msghash, signature)
+        except ValueError as e:
+            raise exc.SignatureError from e
+
+    def sign_batch(
+        self,
+        msghashes: typing.Iterable[base.BaseHash],
+        *,
+        executor: typing.Optional[Executor] = None,
+    ) -> typing.List[bytes]:
+        """Return the signatures of several message hashes.
+
+        The hashes are signed one after another, unless ``executor`` is
+        given.
+
+        Args:
+            msghashes (Iterable[:class:`pyflocker.ciphers.base.BaseHash`]):
+                The hash objects to sign.
+
+        Keyword Arguments:
+            executor (Executor, None): The executor to sign the hashes in.
+
+        Returns:
+            list[bytes]: The signatures, in the same order as ``msghashes``.
+
+        Raises:
+            TypeError: if the key is a public key.
+        """
+        if not self._is_private:
+            raise TypeError("Only private keys can sign messages.")
+        sign = self._sign_func
+        if executor is not None:
+            return list(executor.map(sign, msghashes))
+        return [sign(msghash) for msghash in msghashes]
+
+    def verify_batch(
+        self,
+        msghashes: typing.Sequence[base.BaseHash],
+        signatures: typing.Sequence[bytes],
+        *,
+        executor: typing.Optional[Executor] = None,
+    ) -> None:
+        """Verifies the signatures of several message hashes.
+
+        The signatures are verified one after another, unless ``executor``
+        is given.
+
+        Args:
+            msghashes (Sequence[:class:`pyflocker.ciphers.base.BaseHash`]):
+                The hash objects that were signed.
+            signatures (Sequence[bytes]):
+                The signatures, in the same order as ``msghashes``.
+
+        Keyword Arguments:
+            executor (Executor, None):
+                The executor to verify the signatures in.
+
+        Raises:
+            ValueError: if the number of hashes and signatures differ.
+            SignatureError: if any of the signatures was incorrect.
+            TypeError: if the key is a private key.
+        """
+        if self._is_private:
+            raise TypeError("Only public keys can verify messages.")
+        if len(msghashes) != len(signatures):
+            raise ValueError("msghashes and signatures differ in length")
+        verify = self._verify_func
+        try:
+            if executor is not None:
+                list(executor.map(verify, msghashes, signatures))
+                return
+            for msghash, signature in zip(msghashes, signatures):
+                verify(msghash, signature)
         except ValueError as e:
             raise exc.SignatureError from e
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import typing
 from types import MappingProxyType
 
@@ -8,9 +9,6 @@ from Cryptodome.Hash import (
     SHA3_256,
     SHA3_384,
     SHA3_512,
-    SHA224,
-    SHA256,
-    SHA384,
     SHA512,
     SHAKE128,
     SHAKE256,
@@ -25,14 +23,25 @@ from Cryptodome.Hash import (
 
 from ... import base, exc
 
+
+def _sha512_224(data=None):
+    return SHA512.new(data, "224")
+
+
+def _sha512_256(data=None):
+    return SHA512.new(data, "256")
+
+
+# The SHA-2 family is served by hashlib: OpenSSL uses the CPU's SHA
+# extensions where they are available, while Cryptodome does not.
 HASHES = MappingProxyType(
     {
-        "sha224": SHA224.new,
-        "sha256": SHA256.new,
-        "sha384": SHA384.new,
-        "sha512": SHA512.new,
-        "sha512_224": lambda data=b"": SHA512.new(data, "224"),
-        "sha512_256": lambda data=b"": SHA512.new(data, "256"),
+        "sha224": hashlib.sha224,
+        "sha256": hashlib.sha256,
+        "sha384": hashlib.sha384,
+        "sha512": hashlib.sha512,
+        "sha512_224": _sha512_224,
+        "sha512_256": _sha512_256,
         "sha3_224": SHA3_224.new,
         "sha3_256": SHA3_256.new,
         "sha3_384": SHA3_384.new,
@@ -52,6 +61,16 @@ HASHES = MappingProxyType(
     }
 )
 
+# OIDs of the hash functions whose objects do not carry the ``oid`` attribute.
+OIDS = MappingProxyType(
+    {
+        "sha224": "2.16.840.1.101.3.4.2.4",
+        "sha256": "2.16.840.1.101.3.4.2.1",
+        "sha384": "2.16.840.1.101.3.4.2.2",
+        "sha512": "2.16.840.1.101.3.4.2.3",
+    }
+)
+
 # Names of hash functions that support variable digest sizes.
 VAR_DIGEST_SIZE = frozenset(
     {
@@ -111,6 +130,7 @@ class Hash(base.BaseHash):
         "_digest_size",
         "_block_size",
         "_oid",
+        "_is_xof",
     )
 
     def __init__(
@@ -135,9 +155,10 @@ class Hash(base.BaseHash):
             )
 
         self._name = name
+        self._is_xof = name in XOFS
         self._digest_size = getattr(self._ctx, "digest_size", digest_size)
         self._block_size = getattr(self._ctx, "block_size", NotImplemented)
-        self._oid = getattr(self._ctx, "oid", NotImplemented)
+        self._oid = OIDS.get(name) or getattr(self._ctx, "oid", NotImplemented)
 
     @property
     def digest_size(self):
@@ -168,8 +189,8 @@ class Hash(base.BaseHash):
             return self._digest
         ctx, self._ctx = self._ctx, None
 
-        if self.name in XOFS:
-            digest = ctx.read(self.digest_size)  # type: ignore
+        if self._is_xof:
+            digest = ctx.read(self._digest_size)  # type: ignore
         else:
             digest = ctx.digest()  # type: ignore
 
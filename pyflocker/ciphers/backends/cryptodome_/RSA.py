@@ -6,15 +6,24 @@ from Cryptodome.PublicKey import RSA
 
 from ... import base, exc
 from ..asymmetric import OAEP, PSS
-from .asymmetric import PROTECTION_SCHEMES, get_padding_func
+from .asymmetric import (
+    ENCODINGS,
+    FORMATS,
+    PRIVATE_ENCODINGS,
+    PROTECTION_SCHEMES,
+    get_padding_cache_key,
+    get_padding_func,
+)
+
+# Maximum number of padding objects cached per key.
+_MAX_CACHED_PADDINGS = 16
 
 
 class RSAPrivateKey(base.BaseRSAPrivateKey):
-    _encodings = ("PEM", "DER")
-    _formats = {
-        "PKCS1": 1,
-        "PKCS8": 8,
-    }
+    __slots__ = ("_key", "_paddings", "_public_key", "__weakref__")
+
+    _encodings = PRIVATE_ENCODINGS
+    _formats = FORMATS
 
     def __init__(
         self,
@@ -28,6 +37,8 @@ class RSAPrivateKey(base.BaseRSAPrivateKey):
             if not isinstance(n, int):  # pragma: no cover
                 raise TypeError("n must be an integer value")
             self._key = RSA.generate(n, e=e)
+        self._paddings = {}
+        self._public_key = None
 
     @property
     def p(self) -> int:
@@ -60,7 +71,7 @@ class RSAPrivateKey(base.BaseRSAPrivateKey):
         if padding is None:  # pragma: no cover
             padding = OAEP()
         return DecryptorContext(
-            get_padding_func(padding)(self._key, padding),
+            _get_padding(self._paddings, self._key, padding),
         )
 
     def signer(
@@ -70,11 +81,13 @@ class RSAPrivateKey(base.BaseRSAPrivateKey):
         if padding is None:  # pragma: no cover
             padding = PSS()
         return SignerContext(
-            get_padding_func(padding)(self._key, padding),
+            _get_padding(self._paddings, self._key, padding),
         )
 
     def public_key(self) -> RSAPublicKey:
-        return RSAPublicKey(self._key.publickey())
+        if (public_key := self._public_key) is None:
+            public_key = self._public_key = RSAPublicKey(self._key.publickey())
+        return public_key
 
     def serialize(
         self,
@@ -126,18 +139,18 @@ class RSAPrivateKey(base.BaseRSAPrivateKey):
             if encoding == "DER":
                 raise ValueError("cannot use DER with PKCS1 format")
 
-        if passphrase is not None and protection is None:
-            # use a curated encryption choice and not DES-EDE3-CBC
-            protection = "PBKDF2WithHMAC-SHA1AndAES256-CBC"
+        if passphrase is not None:
+            if protection is None:
+                # use a curated encryption choice and not DES-EDE3-CBC
+                protection = "PBKDF2WithHMAC-SHA1AndAES256-CBC"
+            # only other bytes-like objects need to be copied
+            if not isinstance(passphrase, bytes):
+                passphrase = memoryview(passphrase).tobytes()
 
         return self._key.export_key(
             format=encoding,
             pkcs=self._formats[format],
-            passphrase=(
-                memoryview(passphrase).tobytes()  # type: ignore
-                if passphrase is not None
-                else None
-            ),
+            passphrase=passphrase,
             protection=protection,
         )
 
@@ -160,11 +173,14 @@ class RSAPrivateKey(base.BaseRSAPrivateKey):
 
 
 class RSAPublicKey(base.BaseRSAPublicKey):
-    _encodings = ("PEM", "DER", "OpenSSH")
-    _formats = ("SubjectPublicKeyInfo", "OpenSSH")
+    __slots__ = ("_key", "_paddings", "__weakref__")
+
+    _encodings = frozenset(ENCODINGS)
+    _formats = frozenset(("SubjectPublicKeyInfo", "OpenSSH"))
 
     def __init__(self, key):
         self._key = key
+        self._paddings = {}
 
     @property
     def n(self) -> int:
@@ -185,7 +201,7 @@ class RSAPublicKey(base.BaseRSAPublicKey):
         if padding is None:  # pragma: no cover
             padding = OAEP()
         return EncryptorContext(
-            get_padding_func(padding)(self._key, padding),
+            _get_padding(self._paddings, self._key, padding),
         )
 
     def verifier(
@@ -195,7 +211,7 @@ class RSAPublicKey(base.BaseRSAPublicKey):
         if padding is None:  # pragma: no cover
             padding = PSS()
         return VerifierContext(
-            get_padding_func(padding)(self._key, padding),
+            _get_padding(self._paddings, self._key, padding),
         )
 
     def serialize(
@@ -249,43 +265,75 @@ class RSAPublicKey(base.BaseRSAPublicKey):
 
 
 class EncryptorContext(base.BaseEncryptorContext):
+    __slots__ = ("_encrypt_func",)
+
     def __init__(self, ctx):
-        self._ctx = ctx
+        self._encrypt_func = ctx.encrypt
 
     def encrypt(self, plaintext: bytes) -> bytes:
-        return self._ctx.encrypt(plaintext)
+        return self._encrypt_func(plaintext)
 
 
 class DecryptorContext(base.BaseDecryptorContext):
+    __slots__ = ("_decrypt_func",)
+
     def __init__(self, ctx):
-        self._ctx = ctx
+        self._decrypt_func = ctx.decrypt
 
     def decrypt(self, plaintext: bytes) -> bytes:
         try:
-            return self._ctx.decrypt(plaintext)
+            return self._decrypt_func(plaintext)
         except ValueError as e:
             raise exc.DecryptionError from e
 
 
 class SignerContext(base.BaseSignerContext):
+    __slots__ = ("_sign_func",)
+
     def __init__(self, ctx):
-        self._ctx = ctx
+        self._sign_func = ctx.sign
 
     def sign(self, msghash: base.BaseHash) -> bytes:
-        return self._ctx.sign(msghash)
+        return self._sign_func(msghash)
 
 
 class VerifierContext(base.BaseVerifierContext):
+    __slots__ = ("_verify_func",)
+
     def __init__(self, ctx):
-        self._ctx = ctx
+        self._verify_func = ctx.verify
 
     def verify(self, msghash: base.BaseHash, signature: bytes):
         try:
-            self._ctx.verify(msghash, signature)
+            self._verify_func(msghash, signature)
         except ValueError as e:
             raise exc.SignatureError from e
 
 
+def _get_padding(
+    cache: dict,
+    key: RSA.RsaKey,
+    padding: base.BaseAsymmetricPadding,
+):
+    """Return the Cryptodome padding object for ``padding`` and ``key``.
+
+    The padding objects hold no per-operation state, so they are stored in
+    the key's ``cache`` to avoid rebuilding the hash and MGF objects for
+    every context.
+    """
+    cache_key = get_padding_cache_key(padding)
+    try:
+        return cache[cache_key]
+    except KeyError:
+        pass
+
+    ctx = get_padding_func(padding)(key, padding)
+    if len(cache) >= _MAX_CACHED_PADDINGS:
+        cache.clear()
+    cache[cache_key] = ctx
+    return ctx
+
+
 def generate(bits: int, e: int = 65537) -> RSAPrivateKey:
     """
     Generate a private key with given key modulus ``bits`` and public exponent
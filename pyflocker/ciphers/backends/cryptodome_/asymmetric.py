@@ -149,6 +149,9 @@ ENCODINGS = MappingProxyType(
     }
 )
 
+# Private keys cannot be encoded in the OpenSSH encoding.
+PRIVATE_ENCODINGS = frozenset(ENCODINGS.keys() - {"OpenSSH"})
+
 FORMATS = MappingProxyType(
     {
         "PKCS1": 1,
@@ -190,4 +193,28 @@ def get_padding_func(padding):
     return PADDINGS[type(padding)]
 
 
+def _hash_cache_key(hashfunc):
+    if hashfunc is None:
+        return None
+    return type(hashfunc), hashfunc.name, hashfunc.digest_size
+
+
+def get_padding_cache_key(padding) -> tuple:
+    """Return a hashable key identifying the parameters of ``padding``.
+
+    Paddings with equal keys construct equivalent Cryptodome padding objects,
+    which are stateless and can be shared between operations.
+    """
+    mgf = getattr(padding, "mgf", None)
+    label = getattr(padding, "label", None)
+    return (
+        type(padding),
+        _hash_cache_key(getattr(padding, "hashfunc", None)),
+        type(mgf),
+        _hash_cache_key(getattr(mgf, "hashfunc", None)),
+        None if label is None else bytes(label),
+        getattr(padding, "salt_length", None),
+    )
+
+
 del MappingProxyType
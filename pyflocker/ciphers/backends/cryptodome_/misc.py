@@ -5,8 +5,9 @@ Miscellaneous Tools: Tools that are not common to symmetric or asymmetric.
 from __future__ import annotations
 
 import typing
+from functools import lru_cache
 
-from Cryptodome.Protocol import KDF
+from Cryptodome.Hash import HMAC
 
 from ...base import BaseHash
 from . import Hash
@@ -38,27 +39,56 @@ def derive_hkdf_key(
             "hashalgo must be a str or an object implementing BaseHash."
         )
 
+    # HMAC only uses the hash as a template and always calls its `new`
+    # method, so the given object can be used as it is, and the object
+    # created for a name can be reused.
     if isinstance(hashalgo, str):
-        hash_ = Hash.new(hashalgo)
+        hash_ = _hash_template(hashalgo)
     else:
-        # use our hashalgo
-        hash_ = hashalgo.new()
-
-    key = KDF.HKDF(
-        master=master_key,
-        key_len=dklen,
-        salt=salt,
-        hashmod=hash_,
-        num_keys=1,
-        context=cipher_ctx,
-    )
-
-    hkey = KDF.HKDF(
-        master=master_key,
-        key_len=hash_.digest_size,
-        salt=salt,
-        hashmod=hash_,
-        num_keys=1,
-        context=auth_ctx,
-    )
+        hash_ = hashalgo
+
+    # Both keys share the same master key and salt, hence the extract step
+    # of HKDF (RFC 5869) is done once and only the expand step is repeated.
+    if salt is None:
+        salt = bytes(hash_.digest_size)
+    prk = HMAC.new(salt, master_key, hash_).digest()
+
+    key = _hkdf_expand(prk, cipher_ctx, dklen, hash_)
+    hkey = _hkdf_expand(prk, auth_ctx, hash_.digest_size, hash_)
     return key, hkey
+
+
+@lru_cache(maxsize=None)
+def _hash_template(name: str) -> BaseHash:
+    return Hash.new(name)
+
+
+def _hkdf_expand(
+    prk: bytes,
+    info: bytes,
+    length: int,
+    hashmod: BaseHash,
+) -> bytes:
+    """HKDF-Expand step as defined in RFC 5869.
+
+    Args:
+        prk (bytes): The pseudorandom key obtained from the extract step.
+        info (bytes): The context information.
+        length (int): Length of the output keying material.
+        hashmod (BaseHash): The hash function used by HMAC.
+
+    Returns:
+        bytes: The output keying material.
+    """
+    if length > 255 * hashmod.digest_size:
+        raise ValueError("Too much secret data to derive")
+
+    okm = bytearray()
+    block = b""
+    counter = 1
+    while len(okm) < length:
+        msg = block + info + bytes((counter,))
+        block = HMAC.new(prk, msg, hashmod).digest()
+        okm += block
+        counter += 1
+    return bytes(okm[:length])
@@ -25,14 +25,14 @@ class NonAEADCipherTemplate(base.BaseNonAEADCipher):
         return self._encrypting
 
     def update(self, data):
-        if self._update_func is None:
+        if (update_func := self._update_func) is None:
             raise exc.AlreadyFinalized
-        return self._update_func(data)
+        return update_func(data)
 
     def update_into(self, data, out):
-        if self._update_func is None:
+        if (update_func := self._update_func) is None:
             raise exc.AlreadyFinalized
-        self._update_func(data, out)
+        update_func(data, out)
 
     def finalize(self):
         if not self._update_func:
@@ -64,16 +64,18 @@ class AEADCipherTemplate(base.BaseAEADCipher):
         return self._encrypting
 
     def update(self, data):
-        self._updated = True
-        if self._update_func is None:
+        if not self._updated:
+            self._updated = True
+        if (update_func := self._update_func) is None:
             raise exc.AlreadyFinalized
-        return self._update_func(data)
+        return update_func(data)
 
     def update_into(self, data, out):
-        self._updated = True
-        if self._update_func is None:
+        if not self._updated:
+            self._updated = True
+        if (update_func := self._update_func) is None:
             raise exc.AlreadyFinalized
-        self._update_func(data, out)
+        update_func(data, out)
 
     def authenticate(self, data):
         if self._update_func is None:
@@ -235,13 +235,15 @@ class _EAX:
     def update(self, data):
         if self.__ctx is None:
             raise bkx.AlreadyFinalized
-        self._updated = True
+        if not self._updated:
+            self._updated = True
         return self.__ctx.update(data)
 
     def update_into(self, data, out):
         if self.__ctx is None:
             raise bkx.AlreadyFinalized
-        self._updated = True
+        if not self._updated:
+            self._updated = True
         self.__ctx.update_into(data, out)
 
     def finalize(self):
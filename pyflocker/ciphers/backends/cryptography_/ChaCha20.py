@@ -50,9 +50,10 @@ class ChaCha20Poly1305(base.BaseAEADCipher):
         return _DecryptionCtx(ctx, auth)
 
     def _pad_aad(self):
-        if not self._updated and self._len_aad & 0x0F:
-            self._auth.update(bytes(16 - (self._len_aad & 0x0F)))
-        self._updated = True
+        if not self._updated:
+            if self._len_aad & 0x0F:
+                self._auth.update(bytes(16 - (self._len_aad & 0x0F)))
+            self._updated = True
 
     def is_encrypting(self):
         return self._encrypting
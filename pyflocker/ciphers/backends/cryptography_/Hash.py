@@ -167,15 +167,7 @@ class Hash(base.BaseHash):
         """
         Creates a pyca/cryptography based hash function object.
         """
-        hashfunc = HASHES[name]
-
-        digest_size_kwargs = {}
-        if name in VAR_DIGEST_SIZE:
-            if digest_size is None:
-                raise ValueError("digest_size is required")
-            digest_size_kwargs = {"digest_size": digest_size}
-
-        hashobj = hashes.Hash(hashfunc(**digest_size_kwargs))  # type: ignore
+        hashobj = hashes.Hash(_create_algorithm(name, digest_size))
 
         if data is not None:
             hashobj.update(data)
@@ -220,7 +212,21 @@ def _get_hash_algorithm(hashfunc: base.BaseHash) -> hashes.HashAlgorithm:
     Get the cryptography backend specific ``hash algorithm`` object from the
     given hash ``hashfunc``.
     """
-    return new(
-        hashfunc.name,
-        digest_size=hashfunc.digest_size,
-    )._ctx.algorithm  # type: ignore
+    return _create_algorithm(hashfunc.name, hashfunc.digest_size)
+
+
+def _create_algorithm(
+    name: str,
+    digest_size: typing.Optional[int] = None,
+) -> hashes.HashAlgorithm:
+    """
+    Creates a pyca/cryptography hash algorithm object. Unlike a hash context,
+    an algorithm object holds no OpenSSL state.
+    """
+    hashfunc = HASHES[name]
+
+    if name in VAR_DIGEST_SIZE:
+        if digest_size is None:
+            raise ValueError("digest_size is required")
+        return hashfunc(digest_size)  # type: ignore
+    return hashfunc()
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
 from types import MappingProxyType
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from cryptography.hazmat.primitives import serialization as serial
 from cryptography.hazmat.primitives.asymmetric import padding as padding_
+from cryptography.hazmat.primitives.asymmetric import utils
 
 from .. import asymmetric
 from . import Hash
@@ -12,6 +17,31 @@ from . import Hash
 if TYPE_CHECKING:  # pragma: no cover
     from ... import base
 
+# Thread pool shared by the batch operations, created on first use. It is
+# never shut down explicitly: its idle workers are joined when the
+# interpreter exits, and a forked child process drops it (see below).
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# marks the worker threads of the shared pool
+_worker_state = threading.local()
+
+
+def _mark_worker() -> None:
+    _worker_state.in_pool = True
+
+
+def _reset_executor() -> None:
+    # The worker threads do not survive a fork, so a child process must not
+    # submit to the executor inherited from its parent.
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_executor)
+
 
 def get_OAEP(padding: base.BaseAsymmetricPadding):
     """Construct a pyca/cryptography specific OAEP object.
@@ -28,12 +58,10 @@ def get_OAEP(padding: base.BaseAsymmetricPadding):
         raise TypeError("padding must be an instance of OAEP.")
     if not isinstance(padding.mgf, asymmetric.MGF1):
         raise TypeError("MGF must be an instance of MGF1.")
-    return padding_.OAEP(
-        mgf=padding_.MGF1(
-            Hash._get_hash_algorithm(padding.mgf.hashfunc),
-        ),
-        algorithm=Hash._get_hash_algorithm(padding.hashfunc),
-        label=padding.label,
+    return _get_OAEP(
+        _hash_params(padding.mgf.hashfunc),
+        _hash_params(padding.hashfunc),
+        None if padding.label is None else bytes(padding.label),
     )
 
 
@@ -50,14 +78,59 @@ def get_PSS(padding: base.BaseAsymmetricPadding):
         raise TypeError("padding must be an instance of PSS.")
     if not isinstance(padding.mgf, asymmetric.MGF1):
         raise TypeError("MGF must be an instance of MGF1.")
+    return _get_PSS(_hash_params(padding.mgf.hashfunc), padding.salt_length)
+
+
+def _hash_params(hashfunc: base.BaseHash) -> tuple:
+    return hashfunc.name, hashfunc.digest_size
+
+
+# The padding objects of pyca/cryptography are immutable, hence the objects
+# are shared by all paddings with the same parameters.
+@lru_cache(maxsize=64)
+def _get_OAEP(mgf_hash: tuple, hash_: tuple, label):
+    return padding_.OAEP(
+        mgf=padding_.MGF1(Hash._create_algorithm(*mgf_hash)),
+        algorithm=Hash._create_algorithm(*hash_),
+        label=label,
+    )
+
+
+@lru_cache(maxsize=64)
+def _get_PSS(mgf_hash: tuple, salt_length):
     return padding_.PSS(
-        mgf=padding_.MGF1(Hash._get_hash_algorithm(padding.mgf.hashfunc)),
+        mgf=padding_.MGF1(Hash._create_algorithm(*mgf_hash)),
         salt_length=padding_.PSS.MAX_LENGTH
-        if padding.salt_length is None
-        else padding.salt_length,
+        if salt_length is None
+        else salt_length,
     )
 
 
+def get_prehashed(hashfunc: base.BaseHash) -> utils.Prehashed:
+    """Construct a ``Prehashed`` object for signing the digest of ``hashfunc``.
+
+    Args:
+        hashfunc (BaseHash): The hash object whose digest is signed/verified.
+
+    Returns:
+        Prehashed:
+            A pyca/cryptography ``Prehashed`` object, shared by all the hash
+            objects with the same name and digest size.
+    """
+    return _get_prehashed(_hash_params(hashfunc))
+
+
+@lru_cache(maxsize=16)
+def _get_prehashed(hash_: tuple) -> utils.Prehashed:
+    return utils.Prehashed(Hash._create_algorithm(*hash_))
+
+
+# pyca/cryptography paddings equivalent to ``OAEP()`` and ``PSS()``, used
+# when no padding is given. They share the entries of the padding caches.
+DEFAULT_OAEP = _get_OAEP(("sha256", 32), ("sha256", 32), None)
+DEFAULT_PSS = _get_PSS(("sha256", 32), None)
+
+
 PADDINGS = MappingProxyType(
     {
         asymmetric.OAEP: get_OAEP,
@@ -117,3 +190,71 @@ del MappingProxyType, _fmt
 def get_padding_func(padding):
     """Return the appropriate padding factory function based on ``padding``."""
     return PADDINGS[type(padding)]
+
+
+def get_key_loader(data: bytes, loaders: tuple):
+    """Return the loader for the serialized key ``data``.
+
+    Args:
+        data (bytes, bytearray): The serialized key.
+        loaders (tuple):
+            Pairs of the prefix of a serialization format and its loader.
+            The pairs are tried in order.
+
+    Returns:
+        The matching loader or ``None`` if no prefix matched.
+    """
+    for prefix, loader in loaders:
+        if data.startswith(prefix):
+            return loader
+    return None
+
+
+def run_batch(
+    func,
+    *iterables,
+    executor: Optional[Executor] = None,
+) -> list:
+    """Call ``func`` with the items of ``iterables`` in a thread pool.
+
+    pyca/cryptography releases the GIL while OpenSSL signs or verifies,
+    so independent calls can run in parallel on multiple cores. How much
+    is gained depends on the version of pyca/cryptography.
+
+    Args:
+        func: The function to call.
+        iterables: The positional arguments of the calls, as in :func:`map`.
+
+    Keyword Arguments:
+        executor (Executor, None):
+            The executor to run the calls in. If ``None``, a thread pool
+            shared by all the batch operations is used. It is created on
+            first use with a worker per CPU and lives as long as the
+            process. Calls made by a worker of that pool run sequentially
+            in the worker, since waiting on the pool from its own worker
+            can deadlock it.
+
+    Returns:
+        list: The results of the calls, in order.
+
+    Raises:
+        Exception: The first exception raised by a call, if any.
+    """
+    if executor is None:
+        if getattr(_worker_state, "in_pool", False):
+            return list(map(func, *iterables))
+        executor = _get_executor()
+    return list(executor.map(func, *iterables))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    thread_name_prefix="pyflocker",
+                    initializer=_mark_worker,
+                )
+    return _executor
@@ -5,11 +5,13 @@ Miscellaneous Tools: Tools that are not common to symmetric or asymmetric.
 from __future__ import annotations
 
 import typing
+from functools import lru_cache
 
 from cryptography.hazmat.backends import default_backend as defb
+from cryptography.hazmat.primitives import hmac
 from cryptography.hazmat.primitives.ciphers import Cipher
 from cryptography.hazmat.primitives.ciphers import algorithms as algo
-from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.kdf.hkdf import HKDFExpand
 
 from ...base import BaseHash
 from .Hash import HASHES as _hashes
@@ -43,28 +45,29 @@ def derive_hkdf_key(
         )
 
     if isinstance(hashalgo, str):
-        hash_ = _hashes[hashalgo]()
+        hash_ = _hash_algorithm(hashalgo)
     else:
         hash_ = _get_hash_algorithm(hashalgo)
 
-    key = HKDF(
-        hash_,
-        dklen,
-        salt,
-        cipher_ctx,
-        defb(),
-    ).derive(master_key)
-
-    hkey = HKDF(
-        hash_,
-        hash_.digest_size,
-        salt,
-        auth_ctx,
-        defb(),
-    ).derive(master_key)
+    # Both keys share the same master key and salt, hence the extract step
+    # of HKDF (RFC 5869) is done once and only the expand step is repeated.
+    if salt is None:
+        salt = bytes(hash_.digest_size)
+    extractor = hmac.HMAC(salt, hash_, defb())
+    extractor.update(master_key)
+    prk = extractor.finalize()
+
+    key = HKDFExpand(hash_, dklen, cipher_ctx, defb()).derive(prk)
+    hkey = HKDFExpand(hash_, hash_.digest_size, auth_ctx, defb()).derive(prk)
     return key, hkey
 
 
+@lru_cache(maxsize=None)
+def _hash_algorithm(name: str):
+    # hash algorithm objects hold no state and can be shared
+    return _hashes[name]()
+
+
 def derive_poly1305_key(ckey: bytes, nonce: bytes) -> bytes:
     """Generate a poly1305 key.
 
@@ -25,14 +25,14 @@ class NonAEADCipherTemplate(base.BaseNonAEADCipher):
         return self._encrypting
 
     def update(self, data):
-        if self._ctx is None:
+        if (ctx := self._ctx) is None:
             raise exc.AlreadyFinalized
-        return self._ctx.update(data)
+        return ctx.update(data)
 
     def update_into(self, data, out):
-        if self._ctx is None:
+        if (ctx := self._ctx) is None:
             raise exc.AlreadyFinalized
-        self._ctx.update_into(data, out)
+        ctx.update_into(data, out)
 
     def finalize(self):
         if not self._ctx:
@@ -61,16 +61,18 @@ class AEADCipherTemplate(base.BaseAEADCipher):
         return self._encrypting
 
     def update(self, data):
-        if self._ctx is None:
+        if (ctx := self._ctx) is None:
             raise exc.AlreadyFinalized
-        self._updated = True
-        return self._ctx.update(data)
+        if not self._updated:
+            self._updated = True
+        return ctx.update(data)
 
     def update_into(self, data, out):
-        if self._ctx is None:
+        if (ctx := self._ctx) is None:
             raise exc.AlreadyFinalized
-        self._updated = True
-        self._ctx.update_into(data, out)
+        if not self._updated:
+            self._updated = True
+        ctx.update_into(data, out)
 
     def authenticate(self, data):
         if self._ctx is None:
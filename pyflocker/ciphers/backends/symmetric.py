@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import hmac
 import typing
-from functools import partial
 
 from .. import base, exc
 
+_NO_DATA_MSG = "the file has no data ready to read; it must be blocking"
+
 
 class FileCipherWrapper(base.BaseAEADCipher):
     """
@@ -73,7 +74,7 @@ class FileCipherWrapper(base.BaseAEADCipher):
         self,
         file: typing.BinaryIO,
         tag: typing.Optional[bytes] = None,
-        blocksize: int = 16384,
+        blocksize: int = 65536,
     ) -> None:
         """
         Read from ``infile``, pass through cipher and write the output of the
@@ -89,11 +90,17 @@ class FileCipherWrapper(base.BaseAEADCipher):
             tag (bytes-like, None):
                 The tag to verify decryption. If the file is being decrypted,
                 this must be passed.
-            blocksize (int): Maximum amount of data to read in a single call.
+            blocksize (int):
+                Maximum amount of data to read in a single call. Larger
+                blocks spread the per-block Python overhead over more data.
 
         Raises:
             AlreadyFinalized: if the cipher has been finalized.
             ValueError: if the file is being decrypted and tag is not supplied.
+            BlockingIOError:
+                if the file is non-blocking and has no data ready to read.
+                All the data read before is written to ``file``, hence the
+                method can be called again when the file is ready.
         """
         if self._ctx is None:
             raise exc.AlreadyFinalized
@@ -106,16 +113,32 @@ class FileCipherWrapper(base.BaseAEADCipher):
         # localize variables for better performance
         offset = self._offset
         write = file.write
-        reads = iter(partial(self._file.readinto, rbuf), 0)
+        readinto = self._file.readinto
         update = self._ctx.update_into
 
-        for i in reads:
-            if i < blocksize:
-                rbuf = rbuf[:i]
-                buf = buf[: i + offset]
-            update(rbuf, buf)
-            write(rbuf)
-
+        # The full sized views are reused for every block. Only a short read
+        # (usually the last one) needs sliced views.
+        while i := readinto(rbuf):
+            # Unbuffered files and pipes may return less data than requested
+            # before EOF. Fill the block so that the cipher and the writer are
+            # always called with as much data as possible.
+            while i < blocksize and (n := readinto(rbuf[i:])):
+                i += n
+            if i == blocksize:
+                update(rbuf, buf)
+                write(rbuf)
+            else:
+                update(rbuf[:i], buf[: i + offset])
+                write(rbuf[:i])
+                # The data read so far has been processed, so the call can
+                # be repeated once the non-blocking stream has data ready.
+                if n is None:
+                    raise BlockingIOError(_NO_DATA_MSG)
+
+        # Only 0 marks EOF. None is returned by a non-blocking stream that
+        # has no data ready, and finalizing here would truncate the output.
+        if i is None:
+            raise BlockingIOError(_NO_DATA_MSG)
         self.finalize(tag)
 
     def finalize(self, tag=None):
@@ -186,17 +209,19 @@ class HMACWrapper(base.BaseAEADCipher):
         self._len_aad += len(data)
 
     def update(self, data):
-        if self._ctx is None:
+        if (ctx := self._ctx) is None:
             raise exc.AlreadyFinalized
-        self._updated = True
+        if not self._updated:
+            self._updated = True
         self._len_ct += len(data)
-        return self._ctx.update(data)
+        return ctx.update(data)
 
     def update_into(self, data, out):
-        if self._ctx is None:
+        if (ctx := self._ctx) is None:
             raise exc.AlreadyFinalized
-        self._updated = True
-        self._ctx.update_into(data, out)
+        if not self._updated:
+            self._updated = True
+        ctx.update_into(data, out)
         self._len_ct += len(data)
 
     def finalize(self, tag=None):
@@ -241,26 +266,34 @@ class _EncryptionCtx:
         self._ctx = cipher
         self._auth = auth
         self._offset = -offset or None
+        # bound methods are resolved once since they are called per block
+        self._cipher_update = cipher.update
+        self._cipher_update_into = cipher.update_into
+        self._auth_update = auth.update
 
     def update(self, data):
-        ctxt = self._ctx.update(data)
-        self._auth.update(ctxt)
+        ctxt = self._cipher_update(data)
+        self._auth_update(ctxt)
         return ctxt
 
     def update_into(self, data, out):
-        self._ctx.update_into(data, out)
-        self._auth.update(out[: self._offset])
+        self._cipher_update_into(data, out)
+        self._auth_update(out[: self._offset])
 
 
 class _DecryptionCtx:
     def __init__(self, cipher: base.BaseNonAEADCipher, auth):
         self._ctx = cipher
         self._auth = auth
+        # bound methods are resolved once since they are called per block
+        self._cipher_update = cipher.update
+        self._cipher_update_into = cipher.update_into
+        self._auth_update = auth.update
 
     def update(self, data):
-        self._auth.update(data)
-        return self._ctx.update(data)
+        self._auth_update(data)
+        return self._cipher_update(data)
 
     def update_into(self, data, out):
-        self._auth.update(data)
-        self._ctx.update_into(data, out)
+        self._auth_update(data)
+        self._cipher_update_into(data, out)
@@ -5,8 +5,38 @@ from __future__ import annotations
 import typing
 from abc import ABCMeta, abstractmethod
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
 
-class BaseSymmetricCipher(metaclass=ABCMeta):
+
+class _AbstractBase:
+    """Enforces ``abstractmethod`` without using ``ABCMeta``.
+
+    The abstract methods are collected when a subclass is created, like
+    ``ABCMeta`` does, so a class with unimplemented abstract methods still
+    cannot be instantiated. Since the class is a plain ``type``, ``isinstance``
+    checks against it do not go through ``ABCMeta.__instancecheck__``.
+    Virtual subclasses (``register``) are not supported.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        abstracts = {
+            name
+            for name, value in vars(cls).items()
+            if getattr(value, "__isabstractmethod__", False)
+        }
+        for base in cls.__bases__:
+            for name in getattr(base, "__abstractmethods__", ()):
+                value = getattr(cls, name, None)
+                if getattr(value, "__isabstractmethod__", False):
+                    abstracts.add(name)
+        cls.__abstractmethods__ = frozenset(abstracts)
+
+
+class BaseSymmetricCipher(_AbstractBase):
     __slots__ = ()
 
     @abstractmethod
@@ -113,7 +143,7 @@ class BaseAEADCipher(BaseSymmetricCipher):
         """
 
 
-class BaseHash(metaclass=ABCMeta):
+class BaseHash(_AbstractBase):
     """Abstract base class for hash functions. Follows PEP-0452.
 
     Custom MACs must use this interface.
@@ -219,14 +249,16 @@ class BaseHash(metaclass=ABCMeta):
 
 
 class BasePrivateKey(metaclass=ABCMeta):
-    ...
+    __slots__ = ()
 
 
 class BasePublicKey(metaclass=ABCMeta):
-    ...
+    __slots__ = ()
 
 
 class BaseRSAPrivateKey(metaclass=ABCMeta):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def n(self) -> int:
@@ -354,6 +386,8 @@ class BaseRSAPrivateKey(metaclass=ABCMeta):
 
 
 class BaseRSAPublicKey(metaclass=ABCMeta):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def n(self) -> int:
@@ -459,6 +493,8 @@ class BaseMGF(metaclass=ABCMeta):
 
 
 class BaseSignerContext(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def sign(self, msghash: BaseHash) -> bytes:
         """Return the signature of the message hash.
@@ -472,8 +508,36 @@ class BaseSignerContext(metaclass=ABCMeta):
             signature of the message as bytes object.
         """
 
+    def sign_batch(
+        self,
+        msghashes: typing.Iterable[BaseHash],
+        *,
+        executor: typing.Optional[Executor] = None,
+    ) -> typing.List[bytes]:
+        """Return the signatures of several message hashes.
+
+        Backends may sign the hashes concurrently. The default implementation
+        signs them one after another, unless ``executor`` is given.
+
+        Args:
+            msghashes: The :any:`BaseHash` objects to sign.
+
+        Keyword Arguments:
+            executor:
+                An executor to sign the hashes in. If ``None``, the backend
+                decides how the hashes are signed.
+
+        Returns:
+            The signatures, in the same order as ``msghashes``.
+        """
+        if executor is not None:
+            return list(executor.map(self.sign, msghashes))
+        return [self.sign(msghash) for msghash in msghashes]
+
 
 class BaseVerifierContext(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def verify(self, msghash: BaseHash, signature: bytes):
         """Verifies the signature of the message hash.
@@ -489,8 +553,44 @@ class BaseVerifierContext(metaclass=ABCMeta):
             SignatureError: if the signature was incorrect.
         """
 
+    def verify_batch(
+        self,
+        msghashes: typing.Sequence[BaseHash],
+        signatures: typing.Sequence[bytes],
+        *,
+        executor: typing.Optional[Executor] = None,
+    ) -> None:
+        """Verifies the signatures of several message hashes.
+
+        Backends may verify the signatures concurrently. The default
+        implementation verifies them one after another, unless ``executor``
+        is given.
+
+        Args:
+            msghashes: The :any:`BaseHash` objects that were signed.
+            signatures: The signatures, in the same order as ``msghashes``.
+
+        Keyword Arguments:
+            executor:
+                An executor to verify the signatures in. If ``None``, the
+                backend decides how the signatures are verified.
+
+        Raises:
+            ValueError: if the number of hashes and signatures differ.
+            SignatureError: if any of the signatures was incorrect.
+        """
+        if len(msghashes) != len(signatures):
+            raise ValueError("msghashes and signatures differ in length")
+        if executor is not None:
+            list(executor.map(self.verify, msghashes, signatures))
+            return
+        for msghash, signature in zip(msghashes, signatures):
+            self.verify(msghash, signature)
+
 
 class BaseEncryptorContext(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def encrypt(self, plaintext: bytes) -> bytes:
         """Encrypts the plaintext and returns the ciphertext.
@@ -504,6 +604,8 @@ class BaseEncryptorContext(metaclass=ABCMeta):
 
 
 class BaseDecryptorContext(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def decrypt(self, ciphertext: bytes) -> bytes:
         """Decrypts the ciphertext and returns the plaintext.
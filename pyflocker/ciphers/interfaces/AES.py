@@ -2,17 +2,30 @@
 from __future__ import annotations
 
 import typing
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from ..backends import load_algorithm as _load_algo
-from ..modes import Modes
+from ..modes import AEAD, SPECIAL, Modes, aead, special  # noqa: F401
+
+# the mode categories above are re-exported as AES.AEAD, AES.SPECIAL, etc.
 
 if TYPE_CHECKING:  # pragma: no cover
     from .. import base
     from ..backends import Backends
 
 # shortcut for calling like Crypto.Cipher.AES.new(key, AES.MODE_XXX, ...)
-globals().update({val.name: val for val in list(Modes)})
+globals().update((val.name, val) for val in Modes)
+
+
+@lru_cache(maxsize=None)
+def _load_aes_cpr(backend):
+    """Load the cipher module from the backend.
+
+    The module is cached per backend since ciphers are often created for
+    every message.
+    """
+    return _load_algo("AES", backend)
 
 
 def supported_modes(backend: Backends) -> typing.Set[Modes]:
@@ -26,7 +39,7 @@ def supported_modes(backend: Backends) -> typing.Set[Modes]:
     Returns:
         Set of :any:`Modes` supported by the backend.
     """
-    return _load_algo("AES", backend).supported_modes()
+    return _load_aes_cpr(backend).supported_modes()
 
 
 def new(
@@ -68,7 +81,10 @@ def new(
             has no effect.
         file:
             The source file to read from. If ``file`` is specified and the
-            ``mode`` is not an AEAD mode, HMAC is always used.
+            ``mode`` is not an AEAD mode, HMAC is always used. The file is
+            processed in blocks by the ``update_into`` method of the returned
+            object; its ``blocksize`` (64 KiB by default) can be tuned, but
+            blocks smaller than a few KiB are dominated by per-call overhead.
         backend: The backend to use. It must be a value from :any:`Backends`.
 
     Important:
@@ -90,7 +106,7 @@ def new(
     Note:
         Any other error that is raised is from the backend itself.
     """
-    return _load_algo("AES", backend).new(
+    return _load_aes_cpr(backend).new(
         encrypting,
         key,
         mode,
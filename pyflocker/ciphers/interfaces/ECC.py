@@ -17,7 +17,9 @@ def generate(curve: str, *, backend: typing.Optional[_Backends] = None):
     Generate a private key with given curve ``curve``.
 
     Args:
-        curve (str): The name of the curve to use.
+        curve (str):
+            The name of the curve to use. The name is case-insensitive and
+            spaces and hyphens are ignored.
 
     Keyword Arguments:
         backend (:class:`pyflocker.ciphers.backends.Backends`):
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import typing
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from ..backends import Backends as _Backends
@@ -11,17 +12,33 @@ if TYPE_CHECKING:  # pragma: no cover
     from ..base import BaseHash
 
 
+@lru_cache(maxsize=None)
+def _load_hash(backend):
+    """Load the hash module from the backend.
+
+    The module is cached per backend since hash objects are often created
+    for every message.
+    """
+    return _load_algo("Hash", backend)
+
+
 def algorithms_available(
     backend: typing.Optional[_Backends] = None,
 ) -> typing.Set[str]:
     """Returns all available hashes supported by backend."""
     if backend is not None:
-        return _load_algo("Hash", backend).algorithms_available()
+        return _load_hash(backend).algorithms_available()
+    # a copy is returned so that the cached set is never modified
+    return set(_all_algorithms())
+
 
+@lru_cache(maxsize=None)
+def _all_algorithms() -> typing.FrozenSet[str]:
+    """Names of the hash algorithms available from any backend."""
     algos = set()
-    for bknd in list(_Backends):
-        algos.update(_load_algo("Hash", bknd).algorithms_available())
-    return algos
+    for bknd in _Backends:
+        algos.update(_load_hash(bknd).algorithms_available())
+    return frozenset(algos)
 
 
 def new(
@@ -60,7 +77,7 @@ def new(
     Raises:
         KeyError: if the hashing function is not supported or invalid.
     """
-    return _load_algo("Hash", backend).new(
+    return _load_hash(backend).new(
         hashname,
         data,
         digest_size=digest_size,
@@ -169,7 +169,7 @@ def encryptf(
     *,
     kdf: typing.Optional[KDFunc] = None,
     aes_mode: Modes = Modes.MODE_GCM,
-    blocksize: int = 16 * 1024,
+    blocksize: int = 64 * 1024,
     metadata: bytes = METADATA,
     dklen: int = 32,
     backend: typing.Optional[Backends] = None,
@@ -194,7 +194,7 @@ def encryptf(
             mode is stored as a part of the encrypted file.
         blocksize:
             The amount of data to read from ``infile`` in each iteration.
-            Defalts to 16384.
+            Defaults to 65536.
         metadata:
             The metadata to write to the file. It must be up-to 32 bytes.
         dklen:
@@ -275,7 +275,7 @@ def decryptf(
     password: bytes,
     *,
     kdf: typing.Optional[KDFunc] = None,
-    blocksize: int = 16 * 1024,
+    blocksize: int = 64 * 1024,
     metadata: bytes = METADATA,
     dklen: int = 32,
     backend: typing.Optional[Backends] = None,
@@ -295,7 +295,7 @@ def decryptf(
             instead.
         blocksize:
             The amount of data to read from ``infile`` in each iteration.
-            Defalts to 16384.
+            Defaults to 65536.
         metadata:
             The metadata to write to the file. It must be up-to 32 bytes.
         dklen:
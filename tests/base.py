@@ -7,6 +7,47 @@ import pytest
 from pyflocker.ciphers import exc
 from pyflocker.ciphers.backends import Backends
 
+# plaintext of the file tests, shared since BytesIO does not copy bytes
+_PLAINTEXT = bytes(16384)
+
+
+class _ShortReader(io.RawIOBase):
+    """A raw stream that returns at most ``chunk`` bytes every other read."""
+
+    def __init__(self, data, chunk):
+        self._data = io.BytesIO(data)
+        self._chunk = chunk
+        self._short = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        self._short = not self._short
+        if self._short:
+            buf = memoryview(buf)[: self._chunk]
+        return self._data.readinto(buf)
+
+
+class _NonBlockingReader(io.RawIOBase):
+    """A raw stream that has no data ready once, after ``chunk`` bytes."""
+
+    def __init__(self, data, chunk):
+        self._data = io.BytesIO(data)
+        self._chunk = chunk
+        self._reads = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        self._reads += 1
+        if self._reads == 1:
+            return self._data.readinto(memoryview(buf)[: self._chunk])
+        if self._reads == 2:
+            return None
+        return self._data.readinto(buf)
+
 
 def _create_buffer(length, offset, backend):
     if backend == Backends.CRYPTOGRAPHY:
@@ -70,7 +111,7 @@ class BaseSymmetric:
             dec.update_into(in_[: len(readbuf)], out)
         except NotImplementedError:
             pytest.skip(f"update_into not supported by {dec}")
-        assert out[: len(readbuf)].tobytes() == readbuf.tobytes()
+        assert out[: len(readbuf)] == readbuf
 
     def test_update(self, cipher, backend1, backend2):
         enc, dec = self._get_cipher(cipher, backend1, backend2)
@@ -127,7 +168,7 @@ class BaseSymmetricAEAD(BaseSymmetric):
         self._test_finalize(enc, dec)
 
     def test_update_into_file_buffer(self, cipher, backend1, backend2):
-        read = io.BytesIO(bytes(16384))
+        read = io.BytesIO(_PLAINTEXT)
         in_ = io.BytesIO()
         out = io.BytesIO()
         auth = bytes(64)
@@ -138,7 +179,7 @@ class BaseSymmetricAEAD(BaseSymmetric):
             pytest.skip(f"Unsupported by {backend1}")
 
         enc.authenticate(auth)
-        enc.update_into(in_, blocksize=1024)
+        enc.update_into(in_, blocksize=8192)
         in_.seek(0)
 
         try:
@@ -147,6 +188,64 @@ class BaseSymmetricAEAD(BaseSymmetric):
             pytest.skip(f"Unsupported by {backend2}")
 
         dec.authenticate(auth)
+        dec.update_into(out, blocksize=8192, tag=enc.calculate_tag())
+
+        assert out.getvalue() == _PLAINTEXT
+
+    def test_update_into_file_short_reads(self, cipher, backend1, backend2):
+        data = bytes(range(256)) * 65
+        in_ = io.BytesIO()
+        out = io.BytesIO()
+
+        try:
+            enc = cipher(
+                encrypting=True,
+                file=_ShortReader(data, 100),
+                backend=backend1,
+            )
+        except exc.UnsupportedAlgorithm:
+            pytest.skip(f"Unsupported by {backend1}")
+
+        enc.update_into(in_, blocksize=1024)
+        in_.seek(0)
+
+        try:
+            dec = cipher(encrypting=False, file=in_, backend=backend2)
+        except exc.UnsupportedAlgorithm:
+            pytest.skip(f"Unsupported by {backend2}")
+
+        dec.update_into(out, blocksize=1024, tag=enc.calculate_tag())
+
+        assert out.getvalue() == data
+
+    @pytest.mark.parametrize("chunk", [100, 1024])
+    def test_update_into_file_no_data_ready(
+        self, cipher, backend1, backend2, chunk
+    ):
+        data = bytes(range(256)) * 16
+        in_ = io.BytesIO()
+        out = io.BytesIO()
+
+        try:
+            enc = cipher(
+                encrypting=True,
+                file=_NonBlockingReader(data, chunk),
+                backend=backend1,
+            )
+        except exc.UnsupportedAlgorithm:
+            pytest.skip(f"Unsupported by {backend1}")
+
+        with pytest.raises(BlockingIOError):
+            enc.update_into(in_, blocksize=1024)
+        # resume once the stream has data ready
+        enc.update_into(in_, blocksize=1024)
+        in_.seek(0)
+
+        try:
+            dec = cipher(encrypting=False, file=in_, backend=backend2)
+        except exc.UnsupportedAlgorithm:
+            pytest.skip(f"Unsupported by {backend2}")
+
         dec.update_into(out, blocksize=1024, tag=enc.calculate_tag())
 
-        assert read.getvalue() == out.getvalue()
+        assert out.getvalue() == data
@@ -22,14 +22,26 @@ TEST_VECTOR_NONCE = hashlib.sha3_512(b"TEST_VECTOR_NONCE for AES").digest()[
 ]
 
 
-@pytest.fixture
-def cipher(key_length, mode, use_hmac, backend1, backend2):
-    for b in backend1, backend2:
+# The capabilities of the backends do not change, so they are queried once
+# for all the tests of the module. ``None`` marks a backend without Camellia.
+@pytest.fixture(scope="module")
+def supported_modes():
+    modes = {}
+    for backend in Backends:
         try:
-            if mode not in Camellia.supported_modes(b):
-                pytest.skip(f"{mode} not supported by Camellia")
+            modes[backend] = Camellia.supported_modes(backend)
         except exc.UnsupportedAlgorithm:
+            modes[backend] = None
+    return modes
+
+
+@pytest.fixture
+def cipher(key_length, mode, use_hmac, backend1, backend2, supported_modes):
+    for b in backend1, backend2:
+        if supported_modes[b] is None:
             pytest.skip(f"Camellia not supported by {b}")
+        if mode not in supported_modes[b]:
+            pytest.skip(f"{mode} not supported by Camellia")
 
     return partial(
         Camellia.new,
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyflocker.ciphers import ECC, exc
+from pyflocker.ciphers.backends import Backends
+from pyflocker.ciphers.interfaces import Hash
+
+SIGNING_DATA = b"SIGNING_DATA for the ECC signer and verifier contexts"
+
+ENCRYPTION_PASSPHRASE = b"ENCRYPTION_PASSPHRASE"
+
+# the Cryptodome backend encrypts PKCS8 keys only with a protection scheme
+PROTECTION = {
+    Backends.CRYPTOGRAPHY: {},
+    Backends.CRYPTODOME: {"protection": "PBKDF2WithHMAC-SHA1AndAES256-CBC"},
+}
+
+
+# Generating a key is the expensive part of these tests, hence the keys are
+# reused throughout the test module.
+@pytest.fixture(scope="module")
+def private_key(curve: str, backend: Backends):
+    try:
+        return ECC.generate(curve, backend=backend)
+    except ValueError:
+        pytest.skip(f"{curve} is not supported by {backend}")
+
+
+@pytest.fixture(scope="module")
+def public_key(private_key):
+    return private_key.public_key()
+
+
+backend_fixture = pytest.mark.parametrize(
+    "backend",
+    list(Backends),
+    scope="module",
+)
+signing_curve_fixture = pytest.mark.parametrize(
+    "curve",
+    ["p256", "secp384r1", "ed25519"],
+    scope="module",
+)
+
+
+def _sign_batch(signer):
+    signer.sign_batch([Hash.new("sha256", SIGNING_DATA)] * 2)
+
+
+@signing_curve_fixture
+@backend_fixture
+class TestSigningVerifying:
+    def test_sign_verify(self, private_key, public_key):
+        signature = private_key.signer().sign(Hash.new("sha256", SIGNING_DATA))
+        verifier = public_key.verifier()
+        verifier.verify(Hash.new("sha256", SIGNING_DATA), signature)
+
+        with pytest.raises(exc.SignatureError):
+            verifier.verify(Hash.new("sha256", b"bogus"), signature)
+
+    def test_batch(self, private_key, public_key):
+        signer = private_key.signer()
+        verifier = public_key.verifier()
+
+        messages = [SIGNING_DATA + bytes([i]) for i in range(4)]
+        signatures = signer.sign_batch(
+            Hash.new("sha256", msg) for msg in messages
+        )
+        assert len(signatures) == len(messages)
+        verifier.verify_batch(
+            [Hash.new("sha256", msg) for msg in messages],
+            signatures,
+        )
+
+        with pytest.raises(exc.SignatureError):
+            verifier.verify_batch(
+                [Hash.new("sha256", msg) for msg in messages],
+                signatures[::-1],
+            )
+        with pytest.raises(ValueError):
+            verifier.verify_batch(
+                [Hash.new("sha256", msg) for msg in messages],
+                signatures[:-1],
+            )
+
+    def test_batch_executor(self, private_key, public_key):
+        messages = [SIGNING_DATA + bytes([i]) for i in range(4)]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            signatures = private_key.signer().sign_batch(
+                [Hash.new("sha256", msg) for msg in messages],
+                executor=executor,
+            )
+            verifier = public_key.verifier()
+            verifier.verify_batch(
+                [Hash.new("sha256", msg) for msg in messages],
+                signatures,
+                executor=executor,
+            )
+            with pytest.raises(exc.SignatureError):
+                verifier.verify_batch(
+                    [Hash.new("sha256", msg) for msg in messages],
+                    signatures[::-1],
+                    executor=executor,
+                )
+
+    def test_batch_wrong_key(self, private_key, public_key):
+        with pytest.raises(TypeError):
+            public_key.verifier().sign_batch([Hash.new("sha256")])
+        with pytest.raises(TypeError):
+            private_key.signer().verify_batch([Hash.new("sha256")], [b""])
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_batch_after_fork(self, private_key):
+        signer = private_key.signer()
+        # a batch run in the parent creates the thread pool of the backend
+        _sign_batch(signer)
+
+        proc = multiprocessing.get_context("fork").Process(
+            target=_sign_batch,
+            args=(signer,),
+        )
+        proc.start()
+        proc.join(timeout=30)
+        if proc.is_alive():
+            proc.kill()
+            pytest.fail("sign_batch hung in the forked process")
+        assert proc.exitcode == 0
+
+
+@pytest.mark.parametrize("curve", ["p256"], scope="module")
+@pytest.mark.parametrize("backend", [Backends.CRYPTOGRAPHY], scope="module")
+def test_batch_in_shared_pool(private_key):
+    from pyflocker.ciphers.backends.cryptography_.asymmetric import run_batch
+
+    signer = private_key.signer()
+    # occupy every worker of the shared pool with a nested batch
+    thread = threading.Thread(
+        target=run_batch,
+        args=(_sign_batch, [signer] * 2 * (os.cpu_count() or 1)),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive(), "nested sign_batch deadlocked the pool"
+
+
+@pytest.mark.parametrize("curve", ["p256"], scope="module")
+@backend_fixture
+def test_weakref(private_key, public_key):
+    assert weakref.ref(private_key)() is private_key
+    assert weakref.ref(public_key)() is public_key
+
+
+@backend_fixture
+class TestCurveNames:
+    @pytest.mark.parametrize(
+        "curve",
+        ["P256", "p-256", "nist p-256", "NIST P-256", "SECP256R1"],
+    )
+    def test_case_and_separators_ignored(self, curve, backend):
+        key = ECC.generate(curve, backend=backend)
+        assert key.public_key().serialize()
+
+    @pytest.mark.parametrize("curve", ["p257", "", None])
+    def test_invalid_curve(self, curve, backend):
+        with pytest.raises(ValueError):
+            ECC.generate(curve, backend=backend)
+
+
+@pytest.mark.parametrize("curve", ["p256"], scope="module")
+@backend_fixture
+class TestPrivateKeyEncoding:
+    @pytest.mark.parametrize("passphrase_type", [bytes, bytearray, memoryview])
+    def test_passphrase_types(self, private_key, backend, passphrase_type):
+        passphrase = passphrase_type(ENCRYPTION_PASSPHRASE)
+        serialized = private_key.serialize(
+            passphrase=passphrase,
+            **PROTECTION[backend],
+        )
+        key = ECC.load_private_key(serialized, passphrase, backend=backend)
+        assert key.serialize() == private_key.serialize()
+
+
+@pytest.mark.parametrize(
+    "curve, edwards",
+    [("ed25519", True), ("x25519", False), ("ed448", None), ("x448", None)],
+    scope="module",
+)
+@backend_fixture
+class TestRawEncoding:
+    @pytest.mark.parametrize("data_type", [bytes, bytearray])
+    def test_private_key(self, private_key, edwards, backend, data_type):
+        serialized = private_key.serialize("Raw", "Raw")
+        key = ECC.load_private_key(
+            data_type(serialized),
+            edwards=edwards,
+            backend=backend,
+        )
+        assert key.serialize("Raw", "Raw") == serialized
+
+    @pytest.mark.parametrize("data_type", [bytes, bytearray])
+    def test_public_key(self, public_key, edwards, backend, data_type):
+        serialized = public_key.serialize("Raw", "Raw")
+        key = ECC.load_public_key(
+            data_type(serialized),
+            edwards=edwards,
+            backend=backend,
+        )
+        assert key.serialize("Raw", "Raw") == serialized
+
+    def test_private_key_der_prefix(self, private_key, edwards, backend):
+        # one in 256 raw keys starts with b"0", the prefix of DER keys
+        serialized = b"0" + private_key.serialize("Raw", "Raw")[1:]
+        key = ECC.load_private_key(
+            serialized, edwards=edwards, backend=backend
+        )
+        assert key.serialize("Raw", "Raw") == serialized
+
+
+@pytest.mark.parametrize("length", [32, 56])
+def test_raw_public_key_der_prefix(length):
+    # any string of the length is a valid X25519 or X448 public key
+    serialized = b"0" + bytes(range(1, length))
+    key = ECC.load_public_key(
+        serialized,
+        edwards=False,
+        backend=Backends.CRYPTOGRAPHY,
+    )
+    assert key.serialize("Raw", "Raw") == serialized
+
+
+@pytest.mark.parametrize("curve", ["p256", "x25519", "x448"], scope="module")
+@backend_fixture
+class TestExchange:
+    @pytest.fixture
+    def peer_key(self, curve, backend):
+        return ECC.generate(curve, backend=backend)
+
+    def test_exchange(self, private_key, peer_key):
+        try:
+            shared = private_key.exchange(peer_key.public_key())
+        except NotImplementedError:
+            pytest.skip("key exchange is not supported by the backend")
+
+        assert shared == peer_key.exchange(private_key.public_key())
+        for encoding, format in [
+            ("PEM", "SubjectPublicKeyInfo"),
+            ("DER", "SubjectPublicKeyInfo"),
+            ("Raw", "Raw"),
+        ]:
+            try:
+                serialized = peer_key.public_key().serialize(encoding, format)
+            except ValueError:
+                continue
+            assert private_key.exchange(serialized) == shared
+
+    def test_exchange_invalid_type(self, private_key, backend):
+        if backend == Backends.CRYPTODOME:
+            pytest.skip("key exchange is not supported by the backend")
+        with pytest.raises(TypeError):
+            private_key.exchange("not a key")
+
+
+@backend_fixture
+class TestECCErrors:
+    @pytest.mark.parametrize("length", [0, 31, 33, 58])
+    def test_invalid_raw_length(self, backend, length):
+        with pytest.raises(ValueError):
+            ECC.load_private_key(bytes(length), backend=backend)
+        with pytest.raises(ValueError):
+            ECC.load_public_key(bytes(length), backend=backend)
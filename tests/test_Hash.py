@@ -191,3 +191,26 @@ def test_blake2b_with_key_hash_matches(
 ):
     h1, h2 = hashfuncs
     _check_equal_and_check_finalize_once(h1, h2, do_update)
+
+
+@pytest.mark.parametrize(
+    ["name", "hexdigest"],
+    [
+        (
+            "sha512_224",
+            "4634270f707b6a54daae7530460842e20e37ed265ceee9a43e8924aa",
+        ),
+        (
+            "sha512_256",
+            "53048e2681941ef99b2e29b76b4c7dabe4c2d0c634fc6d46e0e2f13107e7af23",
+        ),
+    ],
+)
+@pytest.mark.parametrize("backend", list(Backends))
+def test_truncated_sha512_known_answer(
+    name: str,
+    hexdigest: str,
+    backend: Backends,
+):
+    # FIPS 180-4 example: message "abc"
+    assert Hash.new(name, b"abc", backend=backend).hexdigest() == hexdigest
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import weakref
 from itertools import product
 
 import pytest
@@ -295,6 +296,31 @@ class TestSigningVerifying:
         with pytest.raises(exc.SignatureError):
             verifier.verify(Hash.new("sha256", b"bogus"), signature)
 
+    def test_batch(self, private_key, backend2):
+        public_key = RSA.load_public_key(
+            private_key.public_key().serialize(),
+            backend=backend2,
+        )
+
+        signer = private_key.signer(PSS())
+        verifier = public_key.verifier(PSS())
+
+        messages = [SIGNING_DATA + bytes([i]) for i in range(4)]
+        signatures = signer.sign_batch(
+            Hash.new("sha256", msg) for msg in messages
+        )
+        assert len(signatures) == len(messages)
+        verifier.verify_batch(
+            [Hash.new("sha256", msg) for msg in messages],
+            signatures,
+        )
+
+        with pytest.raises(exc.SignatureError):
+            verifier.verify_batch(
+                [Hash.new("sha256", msg) for msg in messages],
+                signatures[::-1],
+            )
+
 
 @bits_fixture
 @backend_cross_fixture
@@ -396,3 +422,21 @@ class TestRSAErrors:
             public_key.serialize("OpenSSH", "SubjectPublicKeyInfo")
         with pytest.raises(ValueError):
             public_key.serialize("PEM", "OpenSSH")
+
+
+@bits_1024_fixture
+@pytest.mark.parametrize("backend", list(Backends), scope="module")
+def test_weakref(private_key, public_key):
+    assert weakref.ref(private_key)() is private_key
+    assert weakref.ref(public_key)() is public_key
+
+
+def test_default_padding_hashes_not_shared():
+    oaep = OAEP()
+    oaep.hashfunc.update(b"data")
+    oaep.mgf.hashfunc.digest()
+
+    default = OAEP()
+    assert default.hashfunc is not oaep.hashfunc
+    assert default.mgf.hashfunc is not PSS().mgf.hashfunc
+    assert default.hashfunc.digest() == Hash.new("sha256").digest()